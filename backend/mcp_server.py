@@ -5,52 +5,235 @@ Allows natural language interaction with the story generation API
 """
 
 import asyncio
-import requests
-import json
-from typing import Dict, Any, Optional, List
+import atexit
+import httpx
+import orjson
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 from fastmcp import FastMCP
+from rapidfuzz import process, fuzz
 
 # Configuration
 API_BASE_URL = "http://localhost:8000/api"
 
+# Shared async HTTP client so concurrent tool calls overlap on one event
+# loop and reuse pooled keep-alive connections instead of blocking the
+# loop for a full round-trip per request
+_CLIENT = httpx.AsyncClient(
+    base_url=API_BASE_URL,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    http2=True,
+    headers={"Accept": "application/json"},
+)
+
+
+def _close_client():
+    """Close the shared HTTP client on interpreter shutdown"""
+    asyncio.run(_CLIENT.aclose())
+
+
+atexit.register(_close_client)
+
+# Retry policy for idempotent GETs only. POSTs (story creation) are never
+# retried: an ambiguous failure could otherwise create duplicate stories.
+_GET_RETRIES = 3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+async def _get_with_retry(path: str, stream: bool = False) -> httpx.Response:
+    """GET with exponential backoff on transient transport/5xx failures.
+
+    With stream=True the body is read incrementally as chunks arrive
+    instead of waiting on a fully buffered response — useful for large
+    story payloads. The returned response has its content fully read
+    either way.
+    """
+    last_exc = None
+    for attempt in range(_GET_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(0.2 * 2 ** (attempt - 1))
+        try:
+            if stream:
+                async with _CLIENT.stream("GET", path) as response:
+                    if response.status_code in _RETRY_STATUSES and attempt < _GET_RETRIES:
+                        continue
+                    await response.aread()
+                    return response
+            response = await _CLIENT.get(path)
+        except httpx.TransportError as exc:
+            last_exc = exc
+            continue
+        if response.status_code in _RETRY_STATUSES and attempt < _GET_RETRIES:
+            continue
+        return response
+    raise last_exc
+
+# Sentinel for "no story/node selected yet"; a plain int avoids Optional
+# branches on the hot path and keeps a theoretical node id 0 usable
+_NO_ID = -1
+
+
 @dataclass
 class GameState:
     """Tracks the current game state"""
-    current_story_id: Optional[int] = None
-    current_node_id: Optional[int] = None
+    current_story_id: int = _NO_ID
+    current_node_id: int = _NO_ID
     session_id: Optional[str] = None
     last_job_id: Optional[str] = None
     story_data: Optional[Dict] = None
 
-# Global game state
-game_state = GameState()
+# Per-session game state so concurrent MCP clients don't race on a single
+# global GameState; keyed by the caller-supplied session id
+_DEFAULT_SESSION = "default"
+_SESSIONS: Dict[str, GameState] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_state(session_id: Optional[str] = None) -> GameState:
+    """Fetch (or lazily create) the game state for a session"""
+    with _SESSIONS_LOCK:
+        return _SESSIONS.setdefault(session_id or _DEFAULT_SESSION, GameState())
+
+
+# Only bother pre-filtering fuzzy candidates once a node has this many
+# options; below that a straight RapidFuzz scan is already cheap
+_FUZZY_PREFILTER_MIN = 8
+_FUZZY_TOP_K = 8
+
+
+def _trigrams(text: str) -> set:
+    """Set of character trigrams of text (empty for len < 3)"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# LRU cache of raw story payloads so re-requesting the same story (e.g.
+# "what were the options again?") hits memory instead of the network.
+# functools.lru_cache can't wrap a coroutine (it would cache the
+# awaitable, not the bytes), hence the small hand-rolled LRU.
+_STORY_CACHE: "OrderedDict[int, bytes]" = OrderedDict()
+_STORY_CACHE_MAX = 32
+
+
+async def _fetch_story_raw(story_id: int) -> bytes:
+    """Fetch a complete story payload, serving repeats from the LRU cache"""
+    cached = _STORY_CACHE.get(story_id)
+    if cached is not None:
+        _STORY_CACHE.move_to_end(story_id)
+        return cached
+
+    response = await _get_with_retry(f"/stories/{story_id}/complete", stream=True)
+    response.raise_for_status()
+
+    raw = response.content
+    _STORY_CACHE[story_id] = raw
+    if len(_STORY_CACHE) > _STORY_CACHE_MAX:
+        _STORY_CACHE.popitem(last=False)
+    return raw
+
+
+def _node_for(sd: Dict, node_id: int) -> Optional[Dict]:
+    """Look up a node by id, preferring the dense array index"""
+    arr = sd.get("_nodes_arr")
+    if arr is not None:
+        return arr[node_id] if 0 <= node_id < len(arr) else None
+    return sd["_nodes_by_int"].get(node_id)
+
+
+# Slotted result types for the success paths: a single struct allocation
+# per call instead of building a fresh multi-key dict, serialized to JSON
+# by FastMCP at the boundary. Error paths keep their small dict literals.
+
+@dataclass(slots=True)
+class JobStatus:
+    """Status of a story generation job"""
+    success: bool
+    job_id: Optional[str] = None
+    status: Optional[str] = None
+    theme: Optional[str] = None
+    story_id: Optional[int] = None
+    created_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class StoryView:
+    """A freshly loaded story positioned at its root node"""
+    success: bool
+    story_id: int
+    title: str
+    created_at: str
+    current_content: str
+    is_ending: bool
+    options: List[Dict[str, Any]]
+    message: str
+
+
+@dataclass(slots=True)
+class ChoiceResult:
+    """Outcome of a choice and the next story content"""
+    success: bool
+    selected_choice: str
+    current_content: str
+    is_ending: bool
+    options: List[Dict[str, Any]]
+    is_winning_ending: Optional[bool] = None
+    message: Optional[str] = None
+
+
+@dataclass(slots=True)
+class StatusResult:
+    """Current game state snapshot"""
+    success: bool
+    has_active_story: bool
+    story_id: Optional[int] = None
+    story_title: Optional[str] = None
+    current_content: Optional[str] = None
+    is_ending: Optional[bool] = None
+    options: Optional[List[Dict[str, Any]]] = None
+    session_id: Optional[str] = None
+    message: Optional[str] = None
+
+
+@dataclass(slots=True)
+class OptionsList:
+    """Available choices at the current story position"""
+    success: bool
+    options: List[Dict[str, Any]]
+    message: str
 
 # Initialize FastMCP
 app = mcp = FastMCP("Choose Your Own Adventure Game")
 
 @mcp.tool()
-def create_story(theme: str) -> Dict[str, Any]:
+async def create_story(theme: str, session_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Create a new Choose Your Own Adventure story with the given theme.
-    
+
     Args:
         theme: The theme for the story (e.g., "space adventure", "medieval fantasy", "detective mystery")
-    
+        session_id: Game session to create the story under. Defaults to a shared session.
+
     Returns:
         Dictionary with job information to track story generation progress
     """
+    gs = _get_state(session_id)
+
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/stories/create",
-            json={"theme": theme},
-            timeout=30
+        response = await _CLIENT.post(
+            "/stories/create",
+            content=orjson.dumps({"theme": theme}),
+            headers={"Content-Type": "application/json"},
         )
-        
+
         if response.status_code == 200:
-            job_data = response.json()
-            game_state.last_job_id = job_data.get("job_id")
-            game_state.session_id = job_data.get("session_id")
+            job_data = orjson.loads(response.content)
+            gs.last_job_id = job_data.get("job_id")
+            gs.session_id = job_data.get("session_id")
             
             return {
                 "success": True,
@@ -65,25 +248,28 @@ def create_story(theme: str) -> Dict[str, Any]:
                 "error": f"Failed to create story: {response.status_code} - {response.text}"
             }
             
-    except Exception as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         return {
             "success": False,
-            "error": f"Error creating story: {str(e)}"
+            "error": f"Error creating story: {type(e).__name__}: {e}"
         }
 
 @mcp.tool()
-def check_job_status(job_id: Optional[str] = None) -> Dict[str, Any]:
+async def check_job_status(job_id: Optional[str] = None, session_id: Optional[str] = None) -> Union[JobStatus, Dict[str, Any]]:
     """
     Check the status of a story generation job.
-    
+
     Args:
         job_id: The job ID to check. If not provided, uses the last job ID from current session.
-    
+        session_id: Game session the job belongs to. Defaults to a shared session.
+
     Returns:
         Dictionary with job status information
     """
+    gs = _get_state(session_id)
+
     if not job_id:
-        job_id = game_state.last_job_id
+        job_id = gs.last_job_id
     
     if not job_id:
         return {
@@ -92,254 +278,425 @@ def check_job_status(job_id: Optional[str] = None) -> Dict[str, Any]:
         }
     
     try:
-        response = requests.get(f"{API_BASE_URL}/jobs/{job_id}", timeout=30)
+        response = await _get_with_retry(f"/jobs/{job_id}")
         
         if response.status_code == 200:
-            job_data = response.json()
+            job_data = orjson.loads(response.content)
             status = job_data.get("status")
             
             # If job is completed, update game state
             if status == "completed" and job_data.get("story_id"):
-                game_state.current_story_id = job_data.get("story_id")
+                gs.current_story_id = job_data.get("story_id")
             
-            return {
-                "success": True,
-                "job_id": job_data.get("job_id"),
-                "status": status,
-                "theme": job_data.get("theme"),
-                "story_id": job_data.get("story_id"),
-                "created_at": job_data.get("created_at"),
-                "completed_at": job_data.get("completed_at"),
-                "error": job_data.get("error")
-            }
+            return JobStatus(
+                success=True,
+                job_id=job_data.get("job_id"),
+                status=status,
+                theme=job_data.get("theme"),
+                story_id=job_data.get("story_id"),
+                created_at=job_data.get("created_at"),
+                completed_at=job_data.get("completed_at"),
+                error=job_data.get("error")
+            )
         else:
             return {
                 "success": False,
                 "error": f"Failed to get job status: {response.status_code} - {response.text}"
             }
             
-    except Exception as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         return {
             "success": False,
-            "error": f"Error checking job status: {str(e)}"
+            "error": f"Error checking job status: {type(e).__name__}: {e}"
         }
 
 @mcp.tool()
-def get_story(story_id: Optional[int] = None) -> Dict[str, Any]:
+async def wait_for_story(job_id: Optional[str] = None, max_wait_s: int = 60, session_id: Optional[str] = None) -> Union[JobStatus, Dict[str, Any]]:
+    """
+    Wait for a story generation job to finish, polling internally with backoff.
+
+    Batches what would otherwise be many check_job_status calls behind a
+    single MCP call, so the LLM does not have to re-poll the job itself.
+
+    Args:
+        job_id: The job ID to wait for. If not provided, uses the last job ID from current session.
+        max_wait_s: Maximum number of seconds to wait before giving up.
+        session_id: Game session the job belongs to. Defaults to a shared session.
+
+    Returns:
+        Dictionary with the final job status, or an error on timeout
+    """
+    gs = _get_state(session_id)
+
+    if not job_id:
+        job_id = gs.last_job_id
+
+    if not job_id:
+        return {
+            "success": False,
+            "error": "No job ID provided and no active job found"
+        }
+
+    try:
+        deadline = time.monotonic() + max_wait_s
+        attempt = 0
+
+        while True:
+            response = await _get_with_retry(f"/jobs/{job_id}")
+
+            if response.status_code != 200:
+                return {
+                    "success": False,
+                    "error": f"Failed to get job status: {response.status_code} - {response.text}"
+                }
+
+            job_data = orjson.loads(response.content)
+            status = job_data.get("status")
+
+            if status == "completed" and job_data.get("story_id"):
+                gs.current_story_id = job_data.get("story_id")
+
+            if status in ("completed", "failed"):
+                return JobStatus(
+                    success=True,
+                    job_id=job_data.get("job_id"),
+                    status=status,
+                    theme=job_data.get("theme"),
+                    story_id=job_data.get("story_id"),
+                    created_at=job_data.get("created_at"),
+                    completed_at=job_data.get("completed_at"),
+                    error=job_data.get("error")
+                )
+
+            if time.monotonic() >= deadline:
+                return {
+                    "success": False,
+                    "error": f"Timed out after {max_wait_s}s waiting for job {job_id} (last status: {status})"
+                }
+
+            await asyncio.sleep(min(0.25 * 2 ** attempt, 4.0))
+            attempt += 1
+
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        return {
+            "success": False,
+            "error": f"Error waiting for story: {type(e).__name__}: {e}"
+        }
+
+@mcp.tool()
+async def get_story(story_id: Optional[int] = None, session_id: Optional[str] = None) -> Union[StoryView, Dict[str, Any]]:
     """
     Retrieve a complete story and prepare it for interactive gameplay.
-    
+
     Args:
         story_id: The story ID to retrieve. If not provided, uses the current story.
-    
+        session_id: Game session to load the story into. Defaults to a shared session.
+
     Returns:
         Dictionary with complete story data and current position
     """
-    if not story_id:
-        story_id = game_state.current_story_id
-    
-    if not story_id:
+    gs = _get_state(session_id)
+
+    if story_id is None:
+        story_id = gs.current_story_id
+
+    if story_id < 0:
         return {
             "success": False,
             "error": "No story ID provided and no current story found"
         }
     
     try:
-        response = requests.get(f"{API_BASE_URL}/stories/{story_id}/complete", timeout=30)
+        story_data = orjson.loads(await _fetch_story_raw(story_id))
+
+        # Index nodes by int once so the interactive tools can look up
+        # nodes without a str() coercion per call
+        story_data["_nodes_by_int"] = {
+            int(k): v for k, v in story_data["all_nodes"].items()
+        }
+
+        # Cache lowercased option text, an exact-match table and resolved
+        # next-node references per node so make_choice can resolve the
+        # common "player typed the exact option" case with one dict probe
+        # and follow the chosen edge without a second id lookup
+        nodes_by_int = story_data["_nodes_by_int"]
+
+        # When node ids are dense (the common case: sequential row
+        # ids), freeze the index into a list so lookups are an array
+        # index instead of a hash probe; sparse stories keep the dict
+        if nodes_by_int:
+            max_id = max(nodes_by_int)
+            if 0 <= min(nodes_by_int) and max_id < 4 * len(nodes_by_int):
+                nodes_arr = [None] * (max_id + 1)
+                for nid, node in nodes_by_int.items():
+                    nodes_arr[nid] = node
+                story_data["_nodes_arr"] = nodes_arr
+
+        for node in nodes_by_int.values():
+            for opt in node.get("options") or []:
+                opt["_text_lower"] = opt["text"].lower()
+                next_id = opt.get("next_node_id")
+                opt["_next"] = nodes_by_int.get(int(next_id)) if next_id is not None else None
+            # Serializable view of the options without the private
+            # cache keys, for returning to the client
+            node["_options_out"] = [
+                {k: v for k, v in o.items() if not k.startswith("_")}
+                for o in node.get("options") or []
+            ]
+            if not node.get("is_ending"):
+                node["_opt_by_lower"] = {
+                    o["_text_lower"]: o for o in node.get("options") or []
+                }
+                node["_option_texts"] = [
+                    o["text"] for o in node.get("options") or []
+                ]
+                # Inverted trigram index over option text so fuzzy
+                # matching on option-heavy nodes only scores the few
+                # candidates sharing a trigram with the query
+                trigram_index = defaultdict(list)
+                for idx, o in enumerate(node.get("options") or []):
+                    for tri in _trigrams(o["_text_lower"]):
+                        trigram_index[tri].append(idx)
+                node["_trigrams"] = trigram_index
+                # Ready-to-return numbered options so listing choices
+                # allocates nothing per call
+                node["_numbered_options"] = tuple(
+                    {"number": i + 1, "text": o["text"]}
+                    for i, o in enumerate(node.get("options") or [])
+                )
+
+        # Update game state
+        gs.current_story_id = story_id
+        gs.story_data = story_data
+        gs.current_node_id = story_data["root_node"]["id"]
+
+        # Use the indexed (cache-annotated) copy of the root node
+        root_node = nodes_by_int.get(
+            story_data["root_node"]["id"], story_data["root_node"]
+        )
         
-        if response.status_code == 200:
-            story_data = response.json()
-            
-            # Update game state
-            game_state.current_story_id = story_id
-            game_state.story_data = story_data
-            game_state.current_node_id = story_data["root_node"]["id"]
-            
-            root_node = story_data["root_node"]
-            
-            return {
-                "success": True,
-                "story_id": story_data["id"],
-                "title": story_data["title"],
-                "created_at": story_data["created_at"],
-                "current_content": root_node["content"],
-                "is_ending": root_node["is_ending"],
-                "options": root_node.get("options", []),
-                "message": "Story loaded successfully. You can now make choices to progress."
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Failed to get story: {response.status_code} - {response.text}"
-            }
-            
-    except Exception as e:
+        return StoryView(
+            success=True,
+            story_id=story_data["id"],
+            title=story_data["title"],
+            created_at=story_data["created_at"],
+            current_content=root_node["content"],
+            is_ending=root_node["is_ending"],
+            options=root_node.get("_options_out", root_node.get("options", [])),
+            message="Story loaded successfully. You can now make choices to progress."
+        )
+
+    except (httpx.HTTPError, orjson.JSONDecodeError, KeyError) as e:
         return {
             "success": False,
-            "error": f"Error getting story: {str(e)}"
+            "error": f"Error getting story: {type(e).__name__}: {e}"
         }
 
 @mcp.tool()
-def make_choice(choice_text: str) -> Dict[str, Any]:
+def make_choice(choice_text: str, session_id: Optional[str] = None) -> Union[ChoiceResult, Dict[str, Any]]:
     """
     Make a choice in the current story by selecting an option.
-    
+
     Args:
         choice_text: The text of the choice/option to select
-    
+        session_id: Game session to make the choice in. Defaults to a shared session.
+
     Returns:
         Dictionary with the result of the choice and next story content
     """
-    if not game_state.story_data or not game_state.current_node_id:
+    gs = _get_state(session_id)
+    sd = gs.story_data
+
+    if not sd or gs.current_node_id < 0:
         return {
             "success": False,
             "error": "No active story found. Please load a story first using get_story()."
         }
-    
-    try:
-        current_node = game_state.story_data["all_nodes"].get(str(game_state.current_node_id))
-        
-        if not current_node:
-            return {
-                "success": False,
-                "error": "Current story node not found"
-            }
-        
-        if current_node.get("is_ending"):
-            return {
-                "success": False,
-                "error": "Story has ended. Start a new story to continue playing."
-            }
-        
-        options = current_node.get("options", [])
-        if not options:
-            return {
-                "success": False,
-                "error": "No options available at current story position"
-            }
-        
-        # Find matching option (case insensitive partial match)
-        selected_option = None
-        choice_lower = choice_text.lower()
-        
-        for option in options:
-            if choice_lower in option["text"].lower() or option["text"].lower() in choice_lower:
-                selected_option = option
-                break
-        
-        if not selected_option:
-            available_options = [opt["text"] for opt in options]
-            return {
-                "success": False,
-                "error": f"Choice not found. Available options: {available_options}"
-            }
-        
-        # Move to next node
-        next_node_id = selected_option["next_node_id"]
-        next_node = game_state.story_data["all_nodes"].get(str(next_node_id))
-        
-        if not next_node:
-            return {
-                "success": False,
-                "error": "Next story node not found"
-            }
-        
-        # Update current position
-        game_state.current_node_id = next_node_id
-        
-        result = {
-            "success": True,
-            "selected_choice": selected_option["text"],
-            "current_content": next_node["content"],
-            "is_ending": next_node.get("is_ending", False),
-            "options": next_node.get("options", [])
+
+    current_node = _node_for(sd, gs.current_node_id)
+
+    if not current_node:
+        return {
+            "success": False,
+            "error": "Current story node not found"
         }
-        
-        if next_node.get("is_ending"):
-            result["is_winning_ending"] = next_node.get("is_winning_ending", False)
-            result["message"] = "Story completed!"
-        
-        return result
-        
-    except Exception as e:
+
+    if current_node.get("is_ending"):
         return {
             "success": False,
-            "error": f"Error making choice: {str(e)}"
+            "error": "Story has ended. Start a new story to continue playing."
         }
 
+    options = current_node.get("options", [])
+    if not options:
+        return {
+            "success": False,
+            "error": "No options available at current story position"
+        }
+
+    # Find matching option: exact (case insensitive) match first, then
+    # fuzzy match so typos and reordered words still resolve
+    choice_lower = choice_text.lower()
+    selected_option = current_node["_opt_by_lower"].get(choice_lower)
+
+    if not selected_option:
+        candidates = current_node["_option_texts"]
+        candidate_indices = None
+
+        # For option-heavy nodes, narrow the fuzzy scan to the options
+        # sharing at least one trigram with the query
+        if len(candidates) >= _FUZZY_PREFILTER_MIN:
+            overlap = Counter()
+            trigram_index = current_node["_trigrams"]
+            for tri in _trigrams(choice_lower):
+                for idx in trigram_index.get(tri, ()):
+                    overlap[idx] += 1
+            if overlap:
+                candidate_indices = [idx for idx, _ in overlap.most_common(_FUZZY_TOP_K)]
+                candidates = [current_node["_option_texts"][i] for i in candidate_indices]
+
+        match = process.extractOne(
+            choice_text,
+            candidates,
+            scorer=fuzz.WRatio,
+            score_cutoff=60,
+        )
+        if match is not None:
+            idx = candidate_indices[match[2]] if candidate_indices is not None else match[2]
+            selected_option = options[idx]
+
+    if not selected_option:
+        available_options = [opt["text"] for opt in options]
+        return {
+            "success": False,
+            "error": f"Choice not found. Available options: {available_options}"
+        }
+
+    # Move to next node via the reference resolved at load time
+    next_node = selected_option["_next"]
+
+    if not next_node:
+        return {
+            "success": False,
+            "error": "Next story node not found"
+        }
+
+    # Update current position
+    gs.current_node_id = next_node["id"]
+
+    result = ChoiceResult(
+        success=True,
+        selected_choice=selected_option["text"],
+        current_content=next_node["content"],
+        is_ending=next_node.get("is_ending", False),
+        options=next_node.get("_options_out", [])
+    )
+
+    if result.is_ending:
+        result.is_winning_ending = next_node.get("is_winning_ending", False)
+        result.message = "Story completed!"
+
+    return result
+
 @mcp.tool()
-def get_current_status() -> Dict[str, Any]:
+def get_current_status(session_id: Optional[str] = None) -> Union[StatusResult, Dict[str, Any]]:
     """
     Get the current game status and position.
-    
+
+    Args:
+        session_id: Game session to inspect. Defaults to a shared session.
+
     Returns:
         Dictionary with current game state information
     """
-    if not game_state.story_data or not game_state.current_node_id:
-        return {
-            "success": True,
-            "has_active_story": False,
-            "message": "No active story. Create a new story to start playing."
-        }
-    
-    try:
-        current_node = game_state.story_data["all_nodes"].get(str(game_state.current_node_id))
-        
-        return {
-            "success": True,
-            "has_active_story": True,
-            "story_id": game_state.current_story_id,
-            "story_title": game_state.story_data.get("title"),
-            "current_content": current_node["content"],
-            "is_ending": current_node.get("is_ending", False),
-            "options": current_node.get("options", []),
-            "session_id": game_state.session_id
-        }
-        
-    except Exception as e:
+    gs = _get_state(session_id)
+    sd = gs.story_data
+
+    if not sd or gs.current_node_id < 0:
+        return StatusResult(
+            success=True,
+            has_active_story=False,
+            message="No active story. Create a new story to start playing."
+        )
+
+    current_node = _node_for(sd, gs.current_node_id)
+
+    if not current_node:
         return {
             "success": False,
-            "error": f"Error getting status: {str(e)}"
+            "error": "Current story node not found"
         }
 
+    return StatusResult(
+        success=True,
+        has_active_story=True,
+        story_id=gs.current_story_id,
+        story_title=sd.get("title"),
+        current_content=current_node["content"],
+        is_ending=current_node.get("is_ending", False),
+        options=current_node.get("_options_out", []),
+        session_id=gs.session_id
+    )
+
 @mcp.tool()
-def list_available_options() -> Dict[str, Any]:
+def list_available_options(session_id: Optional[str] = None) -> Union[OptionsList, Dict[str, Any]]:
     """
     List all available choices at the current story position.
-    
+
+    Args:
+        session_id: Game session to inspect. Defaults to a shared session.
+
     Returns:
         Dictionary with available options and their details
     """
-    if not game_state.story_data or not game_state.current_node_id:
+    gs = _get_state(session_id)
+    sd = gs.story_data
+
+    if not sd or gs.current_node_id < 0:
         return {
             "success": False,
             "error": "No active story found."
         }
-    
-    try:
-        current_node = game_state.story_data["all_nodes"].get(str(game_state.current_node_id))
-        
-        if current_node.get("is_ending"):
-            return {
-                "success": True,
-                "options": [],
-                "message": "Story has ended. No more choices available."
-            }
-        
-        options = current_node.get("options", [])
-        
-        return {
-            "success": True,
-            "options": [{"number": i+1, "text": opt["text"]} for i, opt in enumerate(options)],
-            "message": f"Available choices: {len(options)}"
-        }
-        
-    except Exception as e:
+
+    current_node = _node_for(sd, gs.current_node_id)
+
+    if not current_node:
         return {
             "success": False,
-            "error": f"Error listing options: {str(e)}"
+            "error": "Current story node not found"
         }
 
+    if current_node.get("is_ending"):
+        return OptionsList(
+            success=True,
+            options=[],
+            message="Story has ended. No more choices available."
+        )
+
+    numbered = current_node.get("_numbered_options", ())
+
+    return OptionsList(
+        success=True,
+        options=numbered,
+        message=f"Available choices: {len(numbered)}"
+    )
+
+@mcp.tool()
+def clear_story_cache() -> Dict[str, Any]:
+    """
+    Clear cached story payloads, forcing fresh fetches from the backend.
+
+    Returns:
+        Dictionary with the number of cached stories dropped
+    """
+    cleared = len(_STORY_CACHE)
+    _STORY_CACHE.clear()
+    return {
+        "success": True,
+        "cleared": cleared,
+        "message": f"Dropped {cleared} cached stories."
+    }
+
 
 def main():
     """Run the MCP server"""